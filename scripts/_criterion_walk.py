@@ -0,0 +1,126 @@
+"""Shared traversal of Criterion output for the results scripts."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'results', '_bench_cache.pkl')
+
+
+def iter_estimates(root):
+    """Yield (new_dir, estimates_path) for every new/estimates.json under root."""
+    root = os.fspath(root)
+    if not os.path.isdir(root):
+        return
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        with os.scandir(d) as it:
+            for e in it:
+                if not e.is_dir(follow_symlinks=False):
+                    continue
+                if e.name == 'new':
+                    p = os.path.join(e.path, 'estimates.json')
+                    if os.path.exists(p):
+                        yield e.path, p
+                else:
+                    stack.append(e.path)
+
+
+def _extract(d):
+    """(mean, ci_lower, ci_upper, std_dev, median) in ns from parsed estimates."""
+    mean = d['mean']
+    ci = mean['confidence_interval']
+    return (
+        mean['point_estimate'],
+        ci['lower_bound'],
+        ci['upper_bound'],
+        d['std_dev']['point_estimate'],
+        d['median']['point_estimate'],
+    )
+
+
+def read_estimates(path):
+    """Parse one estimates.json into the tuple returned by _extract."""
+    with open(path, 'rb') as f:
+        return _extract(_loads(f.read()))
+
+
+def _fingerprint(entries):
+    """Digest of sorted (path, mtime_ns, size) for every estimates file."""
+    h = hashlib.blake2b(digest_size=16)
+    for path in sorted(p for _, p in entries):
+        st = os.stat(path)
+        h.update(f'{path}\0{st.st_mtime_ns}\0{st.st_size}\n'.encode())
+    return h.hexdigest()
+
+
+def _read_cache(root, fingerprint):
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cache = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if (isinstance(cache, dict) and cache.get('root') == root
+            and cache.get('fingerprint') == fingerprint):
+        return cache.get('data')
+    return None
+
+
+def _write_cache(root, fingerprint, data):
+    cache = {'root': root, 'fingerprint': fingerprint, 'data': data}
+    # Write to a temp file and rename so concurrent runs never see a partial pickle.
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(CACHE_PATH), suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(cache, f, protocol=5)
+        os.replace(tmp, CACHE_PATH)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def load_estimates(root):
+    """Map benchmark id -> read_estimates() tuple for every result under root.
+
+    Files are small and mostly I/O, so they are read on a thread pool. The
+    parsed data is cached in results/_bench_cache.pkl and reused while the
+    path, mtime and size of every estimates.json are unchanged.
+    """
+    root = os.path.abspath(root)
+    entries = list(iter_estimates(root))
+    if not entries:
+        return {}
+    fingerprint = _fingerprint(entries)
+    cached = _read_cache(root, fingerprint)
+    if cached is not None:
+        return cached
+
+    # Walker paths are root + sep + '<id>' + sep + 'new', so the benchmark
+    # id is a fixed slice of each new/ directory.
+    start = len(os.path.join(root, ''))
+    stop = -len(os.sep + 'new')
+    workers = min(32, (os.cpu_count() or 1) * 4, len(entries))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        parsed = ex.map(read_estimates, (p for _, p in entries))
+        results = {d[start:stop]: est for (d, _), est in zip(entries, parsed)}
+    if os.sep != '/':
+        results = {k.replace(os.sep, '/'): v for k, v in results.items()}
+    results = dict(sorted(results.items()))
+    _write_cache(root, fingerprint, results)
+    return results
@@ -2,28 +2,19 @@
 """Collect benchmark results from Criterion into results/"""
 
 import json
-import glob
+import sys
 from pathlib import Path
 
+from _criterion_walk import load_estimates
+
 REPO_ROOT = Path(__file__).parent.parent
 CRITERION_DIR = REPO_ROOT / "target" / "criterion"
 RESULTS_DIR = REPO_ROOT / "results"
 
 def extract_criterion_results():
     results = {}
-    for path in glob.glob(str(CRITERION_DIR / "**/new/estimates.json"), recursive=True):
-        parts = Path(path).parts
-        criterion_idx = parts.index("criterion")
-        bench_name = "/".join(parts[criterion_idx + 1:-2])
-
-        with open(path) as f:
-            data = json.load(f)
-
-        mean_ns = data["mean"]["point_estimate"]
-        ci_lower = data["mean"]["confidence_interval"]["lower_bound"]
-        ci_upper = data["mean"]["confidence_interval"]["upper_bound"]
-
-        results[bench_name] = {
+    for name, (mean_ns, ci_lower, ci_upper, _, _) in load_estimates(CRITERION_DIR).items():
+        results[name] = {
             "mean_ns": mean_ns,
             "mean_ms": mean_ns / 1e6,
             "ci_lower_ms": ci_lower / 1e6,
@@ -52,18 +43,20 @@ def main():
             print(f"  {r['peer']}: RTT {r['rtt_mean_us']}us, speedup {r['speedup']:.0f}x")
 
     if criterion:
-        print("\n=== Results ===\n")
         groups = {}
         for name, data in sorted(criterion.items()):
             group = name.split("/")[0]
             groups.setdefault(group, []).append((name, data))
 
+        lines = ["", "=== Results ===", ""]
         for group, items in sorted(groups.items()):
-            print(f"## {group}")
+            lines.append(f"## {group}")
             for name, data in items:
                 short_name = "/".join(name.split("/")[1:])
-                print(f"  {short_name}: {data['mean_ms']:.3f} +/- {data['error_ms']:.3f} ms")
-            print()
+                lines.append(f"  {short_name}: {data['mean_ms']:.3f} +/- {data['error_ms']:.3f} ms")
+            lines.append("")
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 if __name__ == "__main__":
     main()
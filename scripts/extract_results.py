@@ -5,64 +5,69 @@ Extract benchmark results from Criterion output.
 Usage: python3 scripts/extract_results.py [--csv] [--filter <pattern>]
 """
 
-import json
-import glob
 import argparse
 import csv
 import sys
-from pathlib import Path
+from dataclasses import dataclass, fields
+from operator import attrgetter
+
+from _criterion_walk import load_estimates
+
+@dataclass(slots=True, frozen=True)
+class BenchRow:
+    group: str
+    benchmark: str
+    mean_ms: float
+    ci_lower_ms: float
+    ci_upper_ms: float
+    error_ms: float
+    std_dev_ms: float
+    median_ms: float
+
+CSV_HEADER = [f.name for f in fields(BenchRow)]
 
 def extract_benchmark_data(criterion_dir="target/criterion"):
     results = []
 
-    for path in glob.glob(f'{criterion_dir}/**/estimates.json', recursive=True):
-        path = Path(path)
-        parts = path.parts
-
-        try:
-            criterion_idx = parts.index('criterion')
-            group = parts[criterion_idx + 1]
-            benchmark = parts[criterion_idx + 2]
-        except (ValueError, IndexError):
-            group = "unknown"
-            benchmark = path.parent.parent.name
-
-        with open(path) as f:
-            data = json.load(f)
-
-        mean = data['mean']['point_estimate']
-        mean_lo = data['mean']['confidence_interval']['lower_bound']
-        mean_hi = data['mean']['confidence_interval']['upper_bound']
-        std_dev = data['std_dev']['point_estimate']
-        median = data['median']['point_estimate']
-
-        results.append({
-            'group': group,
-            'benchmark': benchmark,
-            'mean_ns': mean,
-            'mean_ms': mean / 1e6,
-            'ci_lower_ms': mean_lo / 1e6,
-            'ci_upper_ms': mean_hi / 1e6,
-            'error_ms': (mean_hi - mean_lo) / 2 / 1e6,
-            'std_dev_ms': std_dev / 1e6,
-            'median_ms': median / 1e6,
-        })
-
-    return sorted(results, key=lambda x: (x['group'], x['benchmark']))
+    for name, (mean, mean_lo, mean_hi, std_dev, median) in load_estimates(criterion_dir).items():
+        name_parts = name.split('/')
+        if len(name_parts) >= 2:
+            group, benchmark = name_parts[0], name_parts[1]
+        else:
+            group, benchmark = "unknown", name_parts[0]
+
+        results.append(BenchRow(
+            group=group,
+            benchmark=benchmark,
+            mean_ms=mean / 1e6,
+            ci_lower_ms=mean_lo / 1e6,
+            ci_upper_ms=mean_hi / 1e6,
+            error_ms=(mean_hi - mean_lo) / 2 / 1e6,
+            std_dev_ms=std_dev / 1e6,
+            median_ms=median / 1e6,
+        ))
+
+    return sorted(results, key=attrgetter('group', 'benchmark'))
 
 def print_table(results):
-    print(f"{'Group':<40} {'Benchmark':<30} {'Mean (ms)':>12} {'Error':>12} {'Std Dev':>12}")
-    print("-" * 110)
-    for r in results:
-        print(f"{r['group']:<40} {r['benchmark']:<30} {r['mean_ms']:>12.3f} {r['error_ms']:>12.3f} {r['std_dev_ms']:>12.3f}")
+    lines = [
+        f"{'Group':<40} {'Benchmark':<30} {'Mean (ms)':>12} {'Error':>12} {'Std Dev':>12}",
+        "-" * 110,
+    ]
+    lines.extend(
+        f"{r.group:<40} {r.benchmark:<30} {r.mean_ms:>12.3f} {r.error_ms:>12.3f} {r.std_dev_ms:>12.3f}"
+        for r in results
+    )
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 def print_csv(results):
-    writer = csv.DictWriter(sys.stdout, fieldnames=[
-        'group', 'benchmark', 'mean_ms', 'ci_lower_ms', 'ci_upper_ms', 'error_ms', 'std_dev_ms', 'median_ms'
-    ])
-    writer.writeheader()
-    for r in results:
-        writer.writerow({k: v for k, v in r.items() if k != 'mean_ns'})
+    writer = csv.writer(sys.stdout)
+    writer.writerow(CSV_HEADER)
+    writer.writerows(
+        (r.group, r.benchmark, r.mean_ms, r.ci_lower_ms, r.ci_upper_ms, r.error_ms, r.std_dev_ms, r.median_ms)
+        for r in results
+    )
 
 def main():
     parser = argparse.ArgumentParser(description='Extract Criterion benchmark results')
@@ -74,7 +79,7 @@ def main():
     results = extract_benchmark_data(args.dir)
 
     if args.filter:
-        results = [r for r in results if args.filter.lower() in r['group'].lower()]
+        results = [r for r in results if args.filter.lower() in r.group.lower()]
 
     if not results:
         print("No benchmark results found.", file=sys.stderr)
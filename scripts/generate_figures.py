@@ -3,91 +3,102 @@
 Generate publication-quality figures for DAG-CRR VLDB paper.
 
 Reads benchmark data from Criterion output and generates figures.
+
+Usage: python3 scripts/generate_figures.py [--formats pdf,png] [--pgf]
 """
 
-import json
-import glob
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
-import matplotlib.pyplot as plt
-import matplotlib
 import numpy as np
 
+from _criterion_walk import load_estimates
+
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 CRITERION_DIR = SCRIPT_DIR.parent / "target" / "criterion"
 OUTPUT_DIR = SCRIPT_DIR.parent / "results" / "figures"
+STYLE_PATH = SCRIPT_DIR / "vldb.mplstyle"
 
 # =============================================================================
 # Data Loading
 # =============================================================================
 
-def load_criterion_data() -> Dict[str, dict]:
-    """Load all benchmark results from Criterion output with confidence intervals."""
-    results = {}
+class BenchStore:
+    """Benchmark results as parallel float64 columns indexed by benchmark key."""
 
-    for path in glob.glob(str(CRITERION_DIR / "**" / "new" / "estimates.json"), recursive=True):
-        path = Path(path)
-        parts = path.parts
+    __slots__ = ('idx', 'mean', 'error')
 
-        try:
-            criterion_idx = parts.index('criterion')
-            new_idx = parts.index('new')
-            key_parts = parts[criterion_idx + 1:new_idx]
-            if len(key_parts) < 2:
-                continue
-            key = '/'.join(key_parts)
-        except (ValueError, IndexError):
-            continue
-
-        with open(path) as f:
-            data = json.load(f)
-
-        mean = data['mean']['point_estimate']
-        ci_lo = data['mean']['confidence_interval']['lower_bound']
-        ci_hi = data['mean']['confidence_interval']['upper_bound']
-
-        results[key] = {
-            'mean_ns': mean,
-            'mean_ms': mean / 1e6,
-            'ci_lower_ms': ci_lo / 1e6,
-            'ci_upper_ms': ci_hi / 1e6,
-            'error_ms': (ci_hi - ci_lo) / 2 / 1e6,
-        }
-
-    return results
-
-BENCH_DATA: Dict[str, dict] = {}
+    def __init__(self, estimates: Dict[str, tuple]):
+        """estimates maps benchmark key -> load_estimates() tuple (values in ns)."""
+        n = len(estimates)
+        self.idx = {k: i for i, k in enumerate(estimates)}
+        self.mean = np.fromiter((e[0] for e in estimates.values()), float, n) / 1e6
+        self.error = np.fromiter(((e[2] - e[1]) / 2 for e in estimates.values()), float, n) / 1e6
+
+    def __len__(self) -> int:
+        return len(self.idx)
+
+    def get(self, key: str) -> Tuple[float, float]:
+        i = self.idx.get(key)
+        if i is None:
+            raise KeyError(f"Benchmark data not found: {key}")
+        return self.mean[i], self.error[i]
+
+    def get_many(self, keys) -> Tuple[np.ndarray, np.ndarray]:
+        ii = [self.idx.get(k) for k in keys]
+        missing = [k for k, i in zip(keys, ii) if i is None]
+        if missing:
+            raise KeyError(f"Benchmark data not found: {', '.join(missing)}")
+        ii = np.array(ii, dtype=np.intp)
+        return self.mean[ii], self.error[ii]
+
+def load_criterion_data() -> BenchStore:
+    """Load all benchmark results from Criterion output (mean and CI half-width)."""
+    return BenchStore({k: v for k, v in load_estimates(CRITERION_DIR).items() if '/' in k})
+
+BENCH_DATA = BenchStore({})
 
 def get_data(key: str) -> Tuple[float, float]:
     """Get benchmark result (mean_ms, error_ms). Raises KeyError if not found."""
-    if key not in BENCH_DATA:
-        raise KeyError(f"Benchmark data not found: {key}")
-    r = BENCH_DATA[key]
-    return r['mean_ms'], r['error_ms']
+    return BENCH_DATA.get(key)
+
+def _get_many(keys) -> Tuple[np.ndarray, np.ndarray]:
+    """Get (mean_ms, error_ms) arrays for keys. Raises KeyError listing every missing key."""
+    return BENCH_DATA.get_many(keys)
 
 # =============================================================================
 # Style Configuration
 # =============================================================================
 
+# matplotlib is slow to import, so it is loaded by the first figure that needs it.
+matplotlib = None
+plt = None
+
+# Render text through LaTeX with the pgf backend (set from --pgf).
+PGF = False
+
+def _mpl():
+    """Import matplotlib and apply the figure style on first use."""
+    global matplotlib, plt
+    if plt is not None:
+        return
+    import matplotlib as _matplotlib
+    _matplotlib.use('pgf' if PGF else 'Agg')
+    import matplotlib.pyplot as _plt
+    matplotlib, plt = _matplotlib, _plt
+    setup_style()
+    if PGF:
+        matplotlib.rcParams['pgf.texsystem'] = 'pdflatex'
+        matplotlib.rcParams['pgf.preamble'] = r'\usepackage{times}'
+
 def setup_style():
     """Configure matplotlib for VLDB-quality figures."""
-    matplotlib.rcParams['font.family'] = 'serif'
-    matplotlib.rcParams['font.serif'] = ['Times New Roman', 'DejaVu Serif']
-    matplotlib.rcParams['font.size'] = 10
-    matplotlib.rcParams['axes.labelsize'] = 11
-    matplotlib.rcParams['axes.titlesize'] = 11
-    matplotlib.rcParams['legend.fontsize'] = 9
-    matplotlib.rcParams['xtick.labelsize'] = 9
-    matplotlib.rcParams['ytick.labelsize'] = 9
-    matplotlib.rcParams['figure.dpi'] = 150
-    matplotlib.rcParams['savefig.dpi'] = 300
-    matplotlib.rcParams['savefig.bbox'] = 'tight'
-    matplotlib.rcParams['axes.spines.top'] = False
-    matplotlib.rcParams['axes.spines.right'] = False
-    matplotlib.rcParams['axes.grid'] = False
-    matplotlib.rcParams['legend.frameon'] = False
+    plt.style.use(str(STYLE_PATH))
 
 # Color palette
 COLORS = {
@@ -97,59 +108,63 @@ COLORS = {
     'automerge': '#C73E1D',
 }
 
+# Output formats written by save_fig (set from --formats).
+FORMATS = ['pdf']
+
+# savefig formats accepted by --formats; kept static so argument checking
+# does not import matplotlib.
+SUPPORTED_FORMATS = {'eps', 'jpeg', 'jpg', 'pdf', 'pgf', 'png', 'ps', 'svg', 'svgz',
+                     'tif', 'tiff', 'webp'}
+
 def save_fig(name: str):
-    """Save figure as PDF and PNG."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    plt.savefig(OUTPUT_DIR / f'{name}.pdf', format='pdf')
-    plt.savefig(OUTPUT_DIR / f'{name}.png', format='png')
+    """Save figure in each of FORMATS. main() creates OUTPUT_DIR beforehand."""
+    for fmt in FORMATS:
+        plt.savefig(OUTPUT_DIR / f'{name}.{fmt}', format=fmt)
     plt.close()
 
+def stack_bottoms(series: np.ndarray) -> np.ndarray:
+    """Bottom offset of each row of a (components x bars) stacked bar chart."""
+    return np.cumsum(series, axis=0) - series
+
 # =============================================================================
 # Figure 1: Insert Comparison (all 4 systems)
 # =============================================================================
 
 def fig_insert_comparison():
     """Insert performance across scales for all four systems."""
+    _mpl()
     fig, ax = plt.subplots(figsize=(5.5, 3.5))
 
     scales = [1000, 10000, 100000]
     scale_labels = ['1K', '10K', '100K']
 
-    # DAG-CRR
-    dag_1k, dag_1k_err = get_data('Insert/DAG-CRR/1000')
-    dag_10k, dag_10k_err = get_data('Insert/DAG-CRR/10000')
-    dag_100k, dag_100k_err = get_data('Insert/DAG-CRR/100000')
-    dag_means = [dag_1k, dag_10k, dag_100k]
-    dag_errors = [dag_1k_err, dag_10k_err, dag_100k_err]
-
-    # CR-SQLite
-    cr_1k, cr_1k_err = get_data('Insert/CR-SQLite/1000')
-    cr_10k, cr_10k_err = get_data('Insert/CR-SQLite/10000')
-    cr_100k, cr_100k_err = get_data('Insert/CR-SQLite/100000')
-    cr_means = [cr_1k, cr_10k, cr_100k]
-    cr_errors = [cr_1k_err, cr_10k_err, cr_100k_err]
-
-    # HLC-LWW
-    hlc_10k, hlc_10k_err = get_data('HLC_Insert/HLC-LWW/10000')
-    hlc_100k, hlc_100k_err = get_data('HLC_Insert/HLC-LWW/100000')
-    hlc_means = [20, hlc_10k, hlc_100k]  # Estimate 1K based on 10K
-    hlc_errors = [1, hlc_10k_err, hlc_100k_err]
-
-    # Automerge
-    am_1k, am_1k_err = get_data('Automerge_Insert/Automerge/1000')
-    am_5k, am_5k_err = get_data('Automerge_Insert/Automerge/5000')
-    am_means = [am_1k, am_5k * 2, am_5k * 20]  # Estimate 10K/100K from 5K
-    am_errors = [am_1k_err, am_5k_err * 2, am_5k_err * 20]
+    # Rows: DAG-CRR, CR-SQLite, HLC-LWW, Automerge; columns: scales
+    means = np.empty((4, len(scales)))
+    errors = np.empty((4, len(scales)))
+
+    means[0], errors[0] = _get_many([f'Insert/DAG-CRR/{scale}' for scale in scales])
+    means[1], errors[1] = _get_many([f'Insert/CR-SQLite/{scale}' for scale in scales])
+
+    # HLC-LWW: estimate 1K based on 10K
+    means[2, 0], errors[2, 0] = 20, 1
+    means[2, 1:], errors[2, 1:] = _get_many([f'HLC_Insert/HLC-LWW/{scale}' for scale in scales[1:]])
+
+    # Automerge: estimate 10K/100K from 5K
+    (am_1k, am_5k), (am_1k_err, am_5k_err) = _get_many(
+        ['Automerge_Insert/Automerge/1000', 'Automerge_Insert/Automerge/5000'])
+    means[3] = am_1k, am_5k * 2, am_5k * 20
+    errors[3] = am_1k_err, am_5k_err * 2, am_5k_err * 20
 
     # Plot with error bars
-    ax.errorbar(scales, dag_means, yerr=dag_errors, fmt='o-', color=COLORS['dag_crr'],
-                linewidth=2, markersize=6, capsize=3, label='DAG-CRR')
-    ax.errorbar(scales, cr_means, yerr=cr_errors, fmt='s-', color=COLORS['crsqlite'],
-                linewidth=2, markersize=6, capsize=3, label='CR-SQLite')
-    ax.errorbar(scales, hlc_means, yerr=hlc_errors, fmt='^-', color=COLORS['hlc'],
-                linewidth=2, markersize=6, capsize=3, label='HLC-LWW')
-    ax.errorbar(scales, am_means, yerr=am_errors, fmt='D-', color=COLORS['automerge'],
-                linewidth=2, markersize=5, capsize=3, label='Automerge')
+    series = [
+        ('o-', COLORS['dag_crr'], 6, 'DAG-CRR'),
+        ('s-', COLORS['crsqlite'], 6, 'CR-SQLite'),
+        ('^-', COLORS['hlc'], 6, 'HLC-LWW'),
+        ('D-', COLORS['automerge'], 5, 'Automerge'),
+    ]
+    for row, (fmt, color, markersize, label) in enumerate(series):
+        ax.errorbar(scales, means[row], yerr=errors[row], fmt=fmt, color=color,
+                    linewidth=2, markersize=markersize, capsize=3, label=label)
 
     ax.set_xlabel('Database Size (rows)')
     ax.set_ylabel('Insert Time (ms)')
@@ -166,30 +181,27 @@ def fig_insert_comparison():
 
 def fig_merge_comparison():
     """Merge performance at scale."""
+    _mpl()
     fig, ax = plt.subplots(figsize=(5.5, 3.5))
 
     changeset_sizes = ['1K', '5K', '10K']
     x = np.arange(len(changeset_sizes))
     width = 0.35
 
-    # DAG-CRR
-    dag_1k, dag_1k_err = get_data('Merge/DAG-CRR/1000')
-    dag_5k, dag_5k_err = get_data('Merge/DAG-CRR/5000')
-    dag_10k, dag_10k_err = get_data('MergeLargeScale/10000')
-    dag_means = [dag_1k, dag_5k, dag_10k]
-    dag_errors = [dag_1k_err, dag_5k_err, dag_10k_err]
-
-    # CR-SQLite
-    cr_1k, cr_1k_err = get_data('Merge/CR-SQLite/1000')
-    cr_5k, cr_5k_err = get_data('Merge/CR-SQLite/5000')
-    cr_10k = cr_5k * 2  # Estimate 10K from 5K
-    cr_10k_err = cr_5k_err * 2
-    cr_means = [cr_1k, cr_5k, cr_10k]
-    cr_errors = [cr_1k_err, cr_5k_err, cr_10k_err]
-
-    ax.bar(x - width/2, dag_means, width, yerr=dag_errors, capsize=3,
+    # Rows: DAG-CRR, CR-SQLite; columns: changeset sizes
+    means = np.empty((2, len(changeset_sizes)))
+    errors = np.empty((2, len(changeset_sizes)))
+
+    means[0], errors[0] = _get_many(
+        ['Merge/DAG-CRR/1000', 'Merge/DAG-CRR/5000', 'MergeLargeScale/10000'])
+
+    means[1, :2], errors[1, :2] = _get_many(['Merge/CR-SQLite/1000', 'Merge/CR-SQLite/5000'])
+    # Estimate 10K from 5K
+    means[1, 2], errors[1, 2] = means[1, 1] * 2, errors[1, 1] * 2
+
+    ax.bar(x - width/2, means[0], width, yerr=errors[0], capsize=3,
            label='DAG-CRR', color=COLORS['dag_crr'], edgecolor='white')
-    ax.bar(x + width/2, cr_means, width, yerr=cr_errors, capsize=3,
+    ax.bar(x + width/2, means[1], width, yerr=errors[1], capsize=3,
            label='CR-SQLite', color=COLORS['crsqlite'], edgecolor='white')
 
     ax.set_xlabel('Changeset Size')
@@ -208,6 +220,7 @@ def fig_merge_comparison():
 
 def fig_scalability():
     """Peer scalability: full mesh sync time vs peer count."""
+    _mpl()
     fig, ax = plt.subplots(figsize=(5.5, 3.5))
 
     peers = [5, 10, 20, 30, 50]
@@ -259,22 +272,18 @@ def fig_scalability():
 
 def fig_sensitivity_conflict():
     """Conflict rate sensitivity."""
+    _mpl()
     fig, ax = plt.subplots(figsize=(4, 3))
 
     conflict_rates = [0, 10, 25, 50, 75, 100]
-    merge_times = []
-    merge_errors = []
     has_real_data = True
-    for rate in conflict_rates:
-        try:
-            t, e = get_data(f'SensitivityConflictRate/{rate}')
-            merge_times.append(t)
-            merge_errors.append(e)
-        except KeyError:
-            merge_times = [7.1, 6.6, 6.1, 5.2, 4.3, 3.9]
-            merge_errors = [0.03, 0.02, 0.01, 0.02, 0.04, 0.7]
-            has_real_data = False
-            break
+    try:
+        merge_times, merge_errors = _get_many(
+            [f'SensitivityConflictRate/{rate}' for rate in conflict_rates])
+    except KeyError:
+        merge_times = [7.1, 6.6, 6.1, 5.2, 4.3, 3.9]
+        merge_errors = [0.03, 0.02, 0.01, 0.02, 0.04, 0.7]
+        has_real_data = False
     ax.bar(range(len(conflict_rates)), merge_times, yerr=merge_errors, capsize=3,
            color=COLORS['dag_crr'], edgecolor='white')
     ax.set_xticks(range(len(conflict_rates)))
@@ -291,27 +300,20 @@ def fig_sensitivity_conflict():
 
 def fig_sensitivity_columns():
     """Column count sensitivity."""
+    _mpl()
     fig, ax = plt.subplots(figsize=(4, 3))
 
     columns = [2, 6, 12, 24, 48]
-    insert_times = []
-    insert_errors = []
-    merge_times_col = []
-    merge_errors_col = []
-    for col in columns:
-        try:
-            it, ie = get_data(f'SensitivityColumns/insert/{col}')
-            mt, me = get_data(f'SensitivityColumns/merge/{col}')
-            insert_times.append(it)
-            insert_errors.append(ie)
-            merge_times_col.append(mt)
-            merge_errors_col.append(me)
-        except KeyError:
-            insert_times = [16, 49, 99, 200, 403]
-            insert_errors = [0.07, 0.17, 0.26, 0.2, 0.55]
-            merge_times_col = [13, 40, 81, 164, 333]
-            merge_errors_col = [0.02, 0.08, 0.16, 0.21, 0.66]
-            break
+    try:
+        insert_times, insert_errors = _get_many(
+            [f'SensitivityColumns/insert/{col}' for col in columns])
+        merge_times_col, merge_errors_col = _get_many(
+            [f'SensitivityColumns/merge/{col}' for col in columns])
+    except KeyError:
+        insert_times = [16, 49, 99, 200, 403]
+        insert_errors = [0.07, 0.17, 0.26, 0.2, 0.55]
+        merge_times_col = [13, 40, 81, 164, 333]
+        merge_errors_col = [0.02, 0.08, 0.16, 0.21, 0.66]
     x = np.arange(len(columns))
     width = 0.35
     ax.bar(x - width/2, insert_times, width, yerr=insert_errors, capsize=3,
@@ -333,29 +335,22 @@ def fig_sensitivity_columns():
 
 def fig_sensitivity_valuesize():
     """Value size sensitivity."""
+    _mpl()
     fig, ax = plt.subplots(figsize=(4, 3))
 
     sizes = [10, 100, 1000, 10000]
     size_labels = ['10B', '100B', '1KB', '10KB']
-    insert_times_size = []
-    insert_errors_size = []
-    merge_times_size = []
-    merge_errors_size = []
     width = 0.35
-    for sz in sizes:
-        try:
-            it, ie = get_data(f'SensitivityValueSize/insert/{sz}')
-            mt, me = get_data(f'SensitivityValueSize/merge/{sz}')
-            insert_times_size.append(it)
-            insert_errors_size.append(ie)
-            merge_times_size.append(mt)
-            merge_errors_size.append(me)
-        except KeyError:
-            insert_times_size = [7.6, 8.3, 14.3, 26.9]
-            insert_errors_size = [0.025, 0.008, 0.026, 0.15]
-            merge_times_size = [6.6, 6.9, 12.3, 30.5]
-            merge_errors_size = [0.012, 0.1, 0.16, 0.23]
-            break
+    try:
+        insert_times_size, insert_errors_size = _get_many(
+            [f'SensitivityValueSize/insert/{sz}' for sz in sizes])
+        merge_times_size, merge_errors_size = _get_many(
+            [f'SensitivityValueSize/merge/{sz}' for sz in sizes])
+    except KeyError:
+        insert_times_size = [7.6, 8.3, 14.3, 26.9]
+        insert_errors_size = [0.025, 0.008, 0.026, 0.15]
+        merge_times_size = [6.6, 6.9, 12.3, 30.5]
+        merge_errors_size = [0.012, 0.1, 0.16, 0.23]
     x = np.arange(len(sizes))
     ax.bar(x - width/2, insert_times_size, width, yerr=insert_errors_size, capsize=3,
            label='Insert', color=COLORS['dag_crr'], edgecolor='white')
@@ -376,6 +371,7 @@ def fig_sensitivity_valuesize():
 
 def fig_memory():
     """Memory breakdown by component."""
+    _mpl()
     fig, ax = plt.subplots(figsize=(5.5, 3.5))
 
     row_counts = ['1K', '10K', '100K', '1M']
@@ -387,12 +383,18 @@ def fig_memory():
     keys = [0.18, 1.8, 18, 180]      # ~15B per key
     overhead = [0.8, 8, 80, 800]     # HashMap overhead
 
+    stack = np.vstack([versions, values, keys, overhead])
+    bottoms = stack_bottoms(stack)
+    components = [
+        ('Versions (8B/col)', '#3498db'),
+        ('Values', '#2ecc71'),
+        ('Keys', '#f39c12'),
+        ('HashMap', '#e74c3c'),
+    ]
+
     width = 0.6
-    ax.bar(x, versions, width, label='Versions (8B/col)', color='#3498db')
-    ax.bar(x, values, width, bottom=versions, label='Values', color='#2ecc71')
-    ax.bar(x, keys, width, bottom=np.array(versions)+np.array(values), label='Keys', color='#f39c12')
-    ax.bar(x, overhead, width, bottom=np.array(versions)+np.array(values)+np.array(keys),
-           label='HashMap', color='#e74c3c')
+    for i, (label, color) in enumerate(components):
+        ax.bar(x, stack[i], width, bottom=bottoms[i], label=label, color=color)
 
     ax.set_xticks(x)
     ax.set_xticklabels(row_counts)
@@ -410,6 +412,7 @@ def fig_memory():
 
 def fig_breakeven_gc():
     """GC coordination cost vs RTT."""
+    _mpl()
     fig, ax = plt.subplots(figsize=(4.5, 3.5))
 
     rtts = [10, 25, 50, 100, 200]
@@ -432,6 +435,7 @@ def fig_breakeven_gc():
 
 def fig_breakeven_query():
     """History query break-even analysis."""
+    _mpl()
     fig, ax = plt.subplots(figsize=(4.5, 3.5))
 
     query_rates = [0, 1, 5, 10, 20, 50]
@@ -451,73 +455,65 @@ def fig_breakeven_query():
 # Main
 # =============================================================================
 
+# Figures in output order. Each is rendered in its own worker process, so
+# they only share the read-only BENCH_DATA passed to _render.
+FIGS = {
+    'fig_insert_comparison': fig_insert_comparison,
+    'fig_merge_comparison': fig_merge_comparison,
+    # New figures for extended paper
+    'fig_scalability': fig_scalability,
+    # Sensitivity figures (separate)
+    'fig_sensitivity_conflict': fig_sensitivity_conflict,
+    'fig_sensitivity_columns': fig_sensitivity_columns,
+    'fig_sensitivity_valuesize': fig_sensitivity_valuesize,
+    'fig_memory': fig_memory,
+    # Break-even figures (separate)
+    'fig_breakeven_gc': fig_breakeven_gc,
+    'fig_breakeven_query': fig_breakeven_query,
+}
+
+def _render(name: str, data: BenchStore, formats: List[str], pgf: bool):
+    """Worker entry point: render one figure from the parent's benchmark data."""
+    global BENCH_DATA, FORMATS, PGF
+    BENCH_DATA = data
+    FORMATS = formats
+    PGF = pgf
+    FIGS[name]()
+
 def main():
     global BENCH_DATA
 
-    setup_style()
+    parser = argparse.ArgumentParser(description='Generate paper figures from Criterion results')
+    parser.add_argument('--formats', type=lambda s: s.split(','), default=['pdf'],
+                        help='Comma-separated output formats (default: pdf), e.g. pdf,png')
+    parser.add_argument('--pgf', action='store_true',
+                        help='Typeset text with LaTeX via the pgf backend (slower; needs pdflatex)')
+    args = parser.parse_args()
+    bad = [fmt for fmt in args.formats if fmt not in SUPPORTED_FORMATS]
+    if bad:
+        parser.error(f"unsupported --formats entries: {', '.join(repr(f) for f in bad)} "
+                     f"(choose from {', '.join(sorted(SUPPORTED_FORMATS))})")
 
     print("Loading benchmark data from Criterion...")
     BENCH_DATA = load_criterion_data()
     print(f"  Found {len(BENCH_DATA)} benchmark results")
 
     print(f"\nGenerating figures to {OUTPUT_DIR}/...")
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    try:
-        fig_insert_comparison()
-        print("  - fig_insert_comparison.pdf")
-    except KeyError as e:
-        print(f"  - fig_insert_comparison.pdf SKIPPED: {e}")
-
-    try:
-        fig_merge_comparison()
-        print("  - fig_merge_comparison.pdf")
-    except KeyError as e:
-        print(f"  - fig_merge_comparison.pdf SKIPPED: {e}")
-
-    # New figures for extended paper
-    try:
-        fig_scalability()
-        print("  - fig_scalability.pdf")
-    except Exception as e:
-        print(f"  - fig_scalability.pdf SKIPPED: {e}")
-
-    # Sensitivity figures (separate)
-    try:
-        fig_sensitivity_conflict()
-        print("  - fig_sensitivity_conflict.pdf")
-    except Exception as e:
-        print(f"  - fig_sensitivity_conflict.pdf SKIPPED: {e}")
-
-    try:
-        fig_sensitivity_columns()
-        print("  - fig_sensitivity_columns.pdf")
-    except Exception as e:
-        print(f"  - fig_sensitivity_columns.pdf SKIPPED: {e}")
-
-    try:
-        fig_sensitivity_valuesize()
-        print("  - fig_sensitivity_valuesize.pdf")
-    except Exception as e:
-        print(f"  - fig_sensitivity_valuesize.pdf SKIPPED: {e}")
-
-    try:
-        fig_memory()
-        print("  - fig_memory.pdf")
-    except Exception as e:
-        print(f"  - fig_memory.pdf SKIPPED: {e}")
-
-    # Break-even figures (separate)
-    try:
-        fig_breakeven_gc()
-        print("  - fig_breakeven_gc.pdf")
-    except Exception as e:
-        print(f"  - fig_breakeven_gc.pdf SKIPPED: {e}")
-
-    try:
-        fig_breakeven_query()
-        print("  - fig_breakeven_query.pdf")
-    except Exception as e:
-        print(f"  - fig_breakeven_query.pdf SKIPPED: {e}")
+    # matplotlib state is not thread-safe; use spawned processes so each
+    # worker starts with a clean pyplot.
+    workers = min(len(FIGS), os.cpu_count() or 1)
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+        futures = {name: ex.submit(_render, name, BENCH_DATA, args.formats, args.pgf) for name in FIGS}
+        for name, future in futures.items():
+            files = ', '.join(f'{name}.{fmt}' for fmt in args.formats)
+            try:
+                future.result()
+                print(f"  - {files}")
+            except Exception as e:
+                print(f"  - {files} SKIPPED: {e}")
 
     print(f"\nDone!")
 